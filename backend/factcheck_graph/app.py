@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
 import re
 import time
 import uuid
 import os
-import xml.etree.ElementTree as ET
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, TypedDict
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Any, AsyncIterator, Dict, FrozenSet, Iterator, List, Literal, Optional, Set, Tuple, TypedDict
 from urllib.parse import quote, urlparse
 
-import requests
+import aiohttp
+import orjson
+from cachetools import TTLCache
+from lxml import etree
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from langgraph.graph import END, StateGraph
 
@@ -102,7 +112,7 @@ class GraphState(TypedDict):
     recommendations: List[Dict[str, str]]
 
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the",
     "and",
     "for",
@@ -136,21 +146,126 @@ STOPWORDS = {
     "when",
     "what",
     "which",
-}
+})
+
+_WS_RE = re.compile(r"\s+")
+_LINK_RE = re.compile(r"https?://[^\s\"'<>)]+")
+_WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9]{3,}")
+_SENT_RE = re.compile(r"[.!?]\s+")
+_PART_RE = re.compile(r"\b(?:and|but|while|because|,|;)\b")
+_EXT_RE = re.compile(r"\.[a-z0-9]{2,5}$", re.I)
+_QUOTE_SCAN_CHARS = 8000
+# Plain http(s) URLs only; anything with userinfo, odd ports, params or whitespace falls back to urlparse.
+_URL_RE = re.compile(r"^https?://([^/?#:@\[\]\s]+)(?::\d*)?(?=[/?#]|\Z)([^?#;\s]*)(?=[?#]|\Z)", re.I)
+_OPPOSE_RE = re.compile(r"debunk|false|hoax|not true|retracted|denied")
+_SUPPORT_RE = re.compile(r"confirmed|official|announced|reported|verified")
+_BLOCKED_DOMAINS = frozenset(
+    {
+        "r.jina.ai",
+        "duckduckgo.com",
+        "news.google.com",
+        "google.com",
+        "microsoft.com",
+        "bing.com",
+        "localhost",
+        "127.0.0.1",
+    }
+)
+
+
+# Shared HTTP pool: searcher/browser fan-out overlaps network waits instead of serializing them.
+_HTTP_POOL: ContextVar[Optional[Tuple[aiohttp.ClientSession, asyncio.Semaphore]]] = ContextVar(
+    "_HTTP_POOL", default=None
+)
+_BFS_WAVE = 16
+# Page bodies keyed by (fetch kind, URL) -> (cap read, text), bounded to ~8M chars: about one run's
+# candidate bodies. Reused when a rejected BFS candidate is re-queued, when the anchor page is
+# proxied again by the BFS or critic, and across pivot re-fetches.
+_BODY_CACHE: TTLCache = TTLCache(maxsize=8_000_000, ttl=600, getsizeof=lambda v: len(v[1]))
+
+
+@asynccontextmanager
+async def _http_scope() -> AsyncIterator[Tuple[aiohttp.ClientSession, asyncio.Semaphore]]:
+    # One session + semaphore per run, visible to every node and gathered task through the
+    # context. Scoping to the run keeps both on the loop that uses them (serverless hosts start
+    # a loop per request) and guarantees the session is closed. Calls outside a run get a
+    # one-off scope.
+    pool = _HTTP_POOL.get()
+    if pool is not None:
+        yield pool
+        return
+    # Keep-alive + DNS caching let repeat hosts (news.google.com, wikipedia, r.jina.ai) reuse connections.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=30)
+    )
+    pool = (session, asyncio.Semaphore(32))
+    token = _HTTP_POOL.set(pool)
+    try:
+        yield pool
+    finally:
+        _HTTP_POOL.reset(token)
+        await session.close()
+
+
+def _timeout(seconds: float) -> aiohttp.ClientTimeout:
+    # Socket-level budgets only: aiohttp's total/connect timeouts also count time spent queued
+    # for one of the limit_per_host slots, which would fail waves aimed at a single host.
+    return aiohttp.ClientTimeout(total=None, sock_connect=seconds, sock_read=seconds)
+
+
+async def _get_text(url: str, timeout: float, max_chars: Optional[int] = None) -> str:
+    async with _http_scope() as (session, slots), slots:
+        async with session.get(url, timeout=_timeout(timeout)) as r:
+            if r.status >= 400:
+                return ""
+            if max_chars is None:
+                return await r.text(errors="replace")
+            # Decode as we go and stop once the caller's cap of whitespace-collapsed characters
+            # is certainly covered, instead of downloading multi-MB pages.
+            decoder = codecs.getincrementaldecoder(r.charset or "utf-8")(errors="replace")
+            parts: List[str] = []
+            n = 0
+            async for chunk in r.content.iter_chunked(8192):
+                text = decoder.decode(chunk)
+                parts.append(text)
+                n += len(_WS_RE.sub(" ", text))
+                # Each chunk boundary (and the final strip) can merge away at most one space.
+                if n - len(parts) - 1 >= max_chars:
+                    break
+            else:
+                parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
+
+
+async def _get_json(url: str, timeout: float) -> Dict[str, Any]:
+    async with _http_scope() as (session, slots), slots:
+        async with session.get(url, timeout=_timeout(timeout)) as r:
+            if r.status >= 400:
+                return {}
+            # Decode raw bytes directly; also sidesteps DDG's javascript content type.
+            return orjson.loads(await r.read())
 
 
 def _n(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return _WS_RE.sub(" ", (text or "")).strip()
 
 
+@lru_cache(maxsize=8192)
 def _domain(url: str) -> str:
+    m = _URL_RE.match(url)
+    if m:
+        return m.group(1).lower().removeprefix("www.")
     try:
         return (urlparse(url).hostname or "").lower().removeprefix("www.")
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=8192)
 def _canon(url: str) -> str:
+    m = _URL_RE.match(url.strip())
+    if m:
+        return f"https://{m.group(1).lower()}{m.group(2).rstrip('/') or '/'}"
     try:
         p = urlparse(url.strip())
         host = (p.hostname or "").lower()
@@ -163,57 +278,75 @@ def _canon(url: str) -> str:
         return url
 
 
-def _readable(url: str, max_chars: int = 30000) -> str:
+def _body_key(kind: str, url: str) -> Tuple[str, str]:
+    u = url.strip()
+    # Canonical form merges raw and canonicalized spellings of a page; query URLs (feeds,
+    # search verticals) keep their query since it selects the content.
+    return kind, (u if "?" in u else _canon(u))
+
+
+def _cached_body(key: Tuple[str, str], max_chars: int) -> Optional[str]:
+    hit = _BODY_CACHE.get(key)
+    # _n(body)[:max_chars] is prefix-stable, so a body read under a larger cap serves smaller ones.
+    if hit is not None and hit[0] >= max_chars:
+        return hit[1][:max_chars]
+    return None
+
+
+def _store_body(key: Tuple[str, str], max_chars: int, text: str) -> None:
+    # Only successful bodies are cached so a transient failure is retried next time.
+    if not text:
+        return
+    hit = _BODY_CACHE.get(key)
+    if hit is None or max_chars > hit[0]:
+        _BODY_CACHE[key] = (max_chars, text)
+
+
+async def _readable(url: str, max_chars: int = 30000) -> str:
+    u = url if url.startswith("http") else f"https://{url}"
+    key = _body_key("readable", u)
+    cached = _cached_body(key, max_chars)
+    if cached is not None:
+        return cached
     try:
-        u = url if url.startswith("http") else f"https://{url}"
         proxy = f"https://r.jina.ai/http://{u.replace('https://', '').replace('http://', '')}"
-        r = requests.get(proxy, timeout=25)
-        if r.status_code >= 400:
-            return ""
-        return _n(r.text)[:max_chars]
+        text = _n(await _get_text(proxy, 25, max_chars))[:max_chars]
     except Exception:
         return ""
+    _store_body(key, max_chars, text)
+    return text
 
 
 def _extract_links(text: str) -> List[str]:
-    links = re.findall(r"https?://[^\s\"'<>)]+", text or "")
-    cleaned = [_canon(x.rstrip(".,);")) for x in links]
-    seen = set()
-    out = []
-    for x in cleaned:
-        if x in seen:
-            continue
-        seen.add(x)
-        out.append(x)
-    return out
+    # Dedup exact matches first so each distinct href is canonicalized only once.
+    raw = dict.fromkeys(x.rstrip(".,);") for x in _LINK_RE.findall(text or ""))
+    return list(dict.fromkeys(_canon(x) for x in raw))
 
 
 def _keywords(text: str, k: int = 8) -> List[str]:
-    words = re.findall(r"[a-zA-Z][a-zA-Z0-9]{3,}", (text or "").lower())
-    freq: Dict[str, int] = {}
-    for w in words:
-        if w in STOPWORDS:
-            continue
-        freq[w] = freq.get(w, 0) + 1
-    return [x for x, _ in sorted(freq.items(), key=lambda it: it[1], reverse=True)[:k]]
+    words = _WORD_RE.findall((text or "").lower())
+    freq = Counter(w for w in words if w not in STOPWORDS)
+    return [x for x, _ in freq.most_common(k)]
 
 
-def _slug_keywords(url: str, k: int = 8) -> List[str]:
+def _term_set(text: str) -> FrozenSet[str]:
+    return frozenset(w for w in _WORD_RE.findall((text or "").lower()) if w not in STOPWORDS)
+
+
+@lru_cache(maxsize=8192)
+def _slug_keywords(url: str, k: int = 8) -> Tuple[str, ...]:
     p = urlparse(url or "")
     slug = f"{p.path} {p.netloc}".replace("-", " ").replace("_", " ")
-    return _keywords(slug, k)
+    return tuple(_keywords(slug, k))
 
 
-def _term_overlap_score(text: str, terms: List[str]) -> float:
-    if not terms:
+def _term_overlap_score(body_terms: FrozenSet[str], terms: FrozenSet[str]) -> float:
+    if not terms or not body_terms:
         return 0.0
-    t = set(_keywords(text, 30))
-    if not t:
-        return 0.0
-    hits = sum(1 for x in terms if x in t)
-    return hits / max(1, len(terms))
+    return len(body_terms & terms) / len(terms)
 
 
+@lru_cache(maxsize=8192)
 def _quality(url: str) -> Literal["high", "medium", "low"]:
     d = _domain(url)
     if any(d.endswith(x) for x in [".gov", ".edu"]) or "pubmed" in d or "nature.com" in d:
@@ -223,108 +356,129 @@ def _quality(url: str) -> Literal["high", "medium", "low"]:
     return "low"
 
 
+@lru_cache(maxsize=8192)
 def _blocked_domain(url: str) -> bool:
     d = _domain(url)
     if not d:
         return True
-    blocked = {
-        "r.jina.ai",
-        "duckduckgo.com",
-        "news.google.com",
-        "google.com",
-        "microsoft.com",
-        "bing.com",
-        "localhost",
-        "127.0.0.1",
-    }
-    return d in blocked
+    return d in _BLOCKED_DOMAINS
 
 
 def _is_relevant_candidate(
     url: str,
     body: str,
-    anchor_terms: List[str],
-    sub_claim_terms: List[str],
+    anchor_terms: FrozenSet[str],
+    sub_claim_terms: FrozenSet[str],
     source_domain: str,
 ) -> bool:
     if _blocked_domain(url):
         return False
     if len(body) < 240:
         return False
-    overlap_anchor = _term_overlap_score(body, anchor_terms[:12])
-    overlap_sub = _term_overlap_score(body, sub_claim_terms[:14])
-    d = _domain(url)
-    same_domain_boost = bool(source_domain and d.endswith(source_domain))
+    # Tokenize the body once; both term lists are scored against the same top-term set.
+    body_terms = frozenset(_keywords(body, 30))
     # Strong topic lock: either meaningful semantic overlap, or moderate overlap plus source-domain affinity.
-    if overlap_anchor >= 0.22 or overlap_sub >= 0.22:
+    overlap_anchor = _term_overlap_score(body_terms, anchor_terms)
+    if overlap_anchor >= 0.22:
         return True
-    if same_domain_boost and (overlap_anchor >= 0.14 or overlap_sub >= 0.14):
+    overlap_sub = _term_overlap_score(body_terms, sub_claim_terms)
+    if overlap_sub >= 0.22:
         return True
-    return False
+    d = _domain(url)
+    same_domain_boost = bool(source_domain and d.endswith(source_domain))
+    return same_domain_boost and (overlap_anchor >= 0.14 or overlap_sub >= 0.14)
 
 
-def _stance(claim: str, snippet: str) -> Literal["support", "oppose", "neutral"]:
-    t = f"{claim} {snippet}".lower()
-    if any(x in t for x in ["debunk", "false", "hoax", "not true", "retracted", "denied"]):
+def _relevance_terms(state: GraphState) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    # Built once per node so the candidate loop only does set intersections.
+    sub_claim_terms = _keywords(" ".join(state.get("sub_claims", [])), 20)
+    return frozenset(state.get("anchor_terms", [])[:12]), frozenset(sub_claim_terms[:14])
+
+
+def _stance(snippet: str) -> Literal["support", "oppose", "neutral"]:
+    # Judged on the source's own snippet; trigger words in the claim must not flip every source.
+    t = snippet.lower()
+    # Separate searches: a single alternation's non-overlapping matches could let a support
+    # trigger swallow the start of an oppose one ("reportedebunk").
+    if _OPPOSE_RE.search(t):
         return "oppose"
-    if any(x in t for x in ["confirmed", "official", "announced", "reported", "verified"]):
+    if _SUPPORT_RE.search(t):
         return "support"
     return "neutral"
 
 
-def _rss_links(query: str) -> List[str]:
-    q = quote(query)
-    feeds = [
-        f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en",
-        f"https://news.google.com/rss/search?q={q}+debunked&hl=en-US&gl=US&ceid=US:en",
-    ]
+def _rss_item_links(xml: str, chunk_chars: int = 16384) -> List[str]:
+    # Feed the document in slices and drain <item> events between feeds, releasing each item
+    # (and already-seen siblings) so the tree never holds the whole feed.
+    parser = etree.XMLPullParser(events=("end",), tag="item")
     out: List[str] = []
-    for f in feeds:
-        # Prefer direct RSS fetch first; fallback to readable proxy.
+
+    def drain() -> None:
+        for _, item in parser.read_events():
+            link = (item.findtext("link") or "").strip()
+            if link:
+                out.append(_canon(link))
+            item.clear()
+            parent = item.getparent()
+            while parent is not None and item.getprevious() is not None:
+                del parent[0]
+
+    for i in range(0, len(xml), chunk_chars):
+        parser.feed(xml[i : i + chunk_chars])
+        drain()
+    parser.close()
+    drain()
+    return out
+
+
+async def _rss_feed_links(feed: str) -> List[str]:
+    # Prefer direct RSS fetch first; fallback to readable proxy.
+    xml = ""
+    try:
+        xml = await _get_text(feed, 20)
+    except Exception:
         xml = ""
+    if not xml:
+        xml = await _readable(feed, 80000)
+
+    out: List[str] = []
+    if xml:
         try:
-            r = requests.get(f, timeout=20)
-            if r.status_code < 400:
-                xml = r.text
+            out.extend(_rss_item_links(xml))
         except Exception:
-            xml = ""
-        if not xml:
-            xml = _readable(f, 80000)
-
-        if xml:
-            try:
-                root = ET.fromstring(xml)
-                for item in root.findall(".//item"):
-                    link_node = item.find("link")
-                    if link_node is not None and (link_node.text or "").strip():
-                        out.append(_canon((link_node.text or "").strip()))
-            except Exception:
-                out.extend(_extract_links(xml))
+            out.extend(_extract_links(xml))
     return out
 
 
-def _image_vertical_links(query: str) -> List[str]:
+async def _rss_links(query: str) -> List[str]:
+    q = quote(query)
+    feeds = [
+        f"https://news.google.com/rss/search?q={q}&hl=en-US&gl=US&ceid=US:en",
+        f"https://news.google.com/rss/search?q={q}+debunked&hl=en-US&gl=US&ceid=US:en",
+    ]
+    results = await asyncio.gather(*(_rss_feed_links(f) for f in feeds))
+    return [x for links in results for x in links]
+
+
+async def _image_vertical_links(query: str) -> List[str]:
     q = quote(query)
     targets = [
         f"https://www.google.com/search?tbm=isch&q={q}",
         f"https://www.bing.com/images/search?q={q}",
     ]
+    bodies = await asyncio.gather(*(_readable(t, 90000) for t in targets))
     out: List[str] = []
-    for t in targets:
-        body = _readable(t, 90000)
+    for body in bodies:
         if not body:
             continue
         out.extend(_extract_links(body))
     return out
 
 
-def _ddg_links(query: str) -> List[str]:
+async def _ddg_links(query: str) -> List[str]:
     try:
         u = f"https://duckduckgo.com/?q={quote(query)}&format=json&no_html=1&skip_disambig=1"
-        r = requests.get(u, timeout=20)
-        if r.status_code >= 400:
-            return []
-        js = r.json()
+        js = await _get_json(u, 20)
         out = []
         if js.get("AbstractURL"):
             out.append(_canon(js["AbstractURL"]))
@@ -340,16 +494,13 @@ def _ddg_links(query: str) -> List[str]:
         return []
 
 
-def _wiki_links(query: str) -> List[str]:
+async def _wiki_links(query: str) -> List[str]:
     try:
         u = (
             "https://en.wikipedia.org/w/api.php?action=query&list=search"
             f"&srsearch={quote(query)}&utf8=&format=json&origin=*"
         )
-        r = requests.get(u, timeout=20)
-        if r.status_code >= 400:
-            return []
-        js = r.json()
+        js = await _get_json(u, 20)
         out = []
         for s in js.get("query", {}).get("search", [])[:8]:
             t = s.get("title")
@@ -360,25 +511,25 @@ def _wiki_links(query: str) -> List[str]:
         return []
 
 
-def node_decomposer(state: GraphState) -> GraphState:
+async def node_decomposer(state: GraphState) -> GraphState:
     claim = _n(state["claim"])
     input_type = state.get("input_type", "url")
     file_name = _n(state.get("file_name", ""))
     anchor_text = ""
     if state.get("source_url"):
-        anchor_text = _readable(state["source_url"], 45000)
+        anchor_text = await _readable(state["source_url"], 45000)
         if anchor_text:
             claim = _n(claim or anchor_text[:240])
     if input_type in {"image", "document"} and state.get("context"):
         claim = _n(claim or state["context"][:360])
     if not claim and file_name:
-        claim = re.sub(r"\.[a-z0-9]{2,5}$", "", file_name, flags=re.I).replace("-", " ").replace("_", " ")
+        claim = _EXT_RE.sub("", file_name).replace("-", " ").replace("_", " ")
     state["anchor_text"] = anchor_text
     slug_terms = _slug_keywords(state.get("source_url", ""), 8)
-    state["anchor_terms"] = list(dict.fromkeys(_keywords(f"{claim} {anchor_text}", 14) + slug_terms))[:18]
+    state["anchor_terms"] = list(dict.fromkeys([*_keywords(f"{claim} {anchor_text}", 14), *slug_terms]))[:18]
     if not claim and state["source_url"]:
         claim = _n(state["source_url"])
-    parts = [p for p in re.split(r"\b(?:and|but|while|because|,|;)\b", claim) if _n(p)]
+    parts = [p for p in _PART_RE.split(claim) if _n(p)]
     sub_claims = [_n(p) for p in parts[:8] if len(_n(p)) > 15]
     if len(sub_claims) < 4:
         kws = _keywords(claim, 12)
@@ -441,123 +592,186 @@ def node_planner(state: GraphState) -> GraphState:
     return state
 
 
-def node_searcher(state: GraphState) -> GraphState:
+async def node_searcher(state: GraphState) -> GraphState:
     links = []
     input_type = state.get("input_type", "url")
     # Seed directly from submitted article/video readable body first.
     if state.get("anchor_text"):
         links.extend(_extract_links(state["anchor_text"]))
-    for q in state["queries"]:
-        links.extend(_rss_links(q))
+    providers = [_rss_links, _ddg_links, _wiki_links]
+    if input_type == "image":
+        providers.append(_image_vertical_links)
+    queries = state["queries"]
+    results = await asyncio.gather(*(fn(q) for q in queries for fn in providers))
+    # Fetches run together; merge in the original per-query order so the enricher caps still apply.
+    for i in range(len(queries)):
+        per_query = results[i * len(providers) : (i + 1) * len(providers)]
+        links.extend(per_query[0])
         # Keep DDG/Wiki as low-priority enrichers only.
         if len(links) < 120:
-            links.extend(_ddg_links(q))
+            links.extend(per_query[1])
         if len(links) < 140:
-            links.extend(_wiki_links(q))
+            links.extend(per_query[2])
         if input_type == "image":
-            links.extend(_image_vertical_links(q))
+            links.extend(per_query[3])
     if state["source_url"]:
         links.insert(0, _canon(state["source_url"]))
-    dedup = []
-    seen = set()
+    dedup = [l for l in dict.fromkeys(links) if l and not _blocked_domain(l)]
     source_domain = _domain(state.get("source_url", ""))
-    for l in links:
-        if not l or l in seen:
-            continue
-        if _blocked_domain(l):
-            continue
-        seen.add(l)
-        dedup.append(l)
     # Prioritize same-domain and known news-like domains before long-tail.
-    dedup.sort(key=lambda u: (0 if _domain(u).endswith(source_domain) and source_domain else 1, 0 if "news" in _domain(u) else 1))
-    state["discovered_links"] = dedup[:220]
+    # The priority key has four values, so a stable bucket pass replaces the sort.
+    buckets: List[List[str]] = [[], [], [], []]
+    for u in dedup:
+        d = _domain(u)
+        k = (0 if source_domain and d.endswith(source_domain) else 2) + (0 if "news" in d else 1)
+        buckets[k].append(u)
+    state["discovered_links"] = [u for bucket in buckets for u in bucket][:220]
     state["timeline"].append(f"Searcher: collected {len(state['discovered_links'])} candidate links.")
     return state
 
 
+def _sentence_hits(text: str, vocab: Set[str]) -> Iterator[Tuple[int, int, int]]:
+    # Walk sentence breaks and word matches side by side (words never straddle a break), yielding
+    # every sentence span, including ones with no ASCII words, so non-Latin bodies still get a quote.
+    words = _WORD_RE.finditer(text)
+    m = next(words, None)
+    start = 0
+    for brk in chain(_SENT_RE.finditer(text), (None,)):
+        end = brk.start() if brk else len(text)
+        hits: Set[str] = set()
+        while m is not None and m.start() < end:
+            w = m.group().lower()
+            if w in vocab:
+                hits.add(w)
+            m = next(words, None)
+        yield start, end, len(hits)
+        if brk:
+            start = brk.end()
+
+
 def _extract_quote(text: str, claim: str) -> str:
-    sents = re.split(r"[.!?]\s+", text)
     best = ""
     best_score = -1
     claim_words = set(_keywords(claim, 12))
-    for s in sents[:120]:
-        ns = _n(s)
+    span = text[:_QUOTE_SCAN_CHARS]
+    for start, end, score in islice(_sentence_hits(span, claim_words), 120):
+        if score <= best_score or end - start < 40:
+            continue
+        ns = _n(span[start:end])
         if len(ns) < 40:
             continue
-        words = set(_keywords(ns, 12))
-        score = len(claim_words.intersection(words))
-        if score > best_score:
-            best_score = score
-            best = ns
+        best_score = score
+        best = ns
     return best[:320]
 
 
-def node_browser_chain(state: GraphState) -> GraphState:
+async def _fetch_body(url: str) -> str:
+    # Try direct first, then readable proxy fallback.
+    key = _body_key("direct", url)
+    body = _cached_body(key, 40000)
+    if body is None:
+        try:
+            body = _n(await _get_text(url, 20, 40000))[:40000]
+        except Exception:
+            body = ""
+        _store_body(key, 40000, body)
+    if len(body) < 120:
+        body = await _readable(url, 40000)
+    return body
+
+
+def _analyze_wave(
+    pages: List[Tuple[str, str]],
+    anchor_terms: FrozenSet[str],
+    sub_claim_terms: FrozenSet[str],
+    source_domain: str,
+    claim: str,
+    with_links: bool,
+) -> List[Optional[Tuple[str, List[str]]]]:
+    # Pure CPU work (tokenize, relevance gate, quote and link extraction) for a fetched wave, run
+    # via asyncio.to_thread so a ~40KB body per candidate does not stall the event loop.
+    out: List[Optional[Tuple[str, List[str]]]] = []
+    for url, body in pages:
+        if not _is_relevant_candidate(url, body, anchor_terms, sub_claim_terms, source_domain):
+            out.append(None)
+            continue
+        out.append((_extract_quote(body, claim), _extract_links(body) if with_links else []))
+    return out
+
+
+async def node_browser_chain(state: GraphState) -> GraphState:
     links = state["discovered_links"][:120]
     source_seen = set()
     sources: List[Dict[str, Any]] = []
-    queue = list(links)
+    queue = deque(links)
     iterations = 0
-    anchor_terms = state.get("anchor_terms", [])
-    sub_claim_terms = _keywords(" ".join(state.get("sub_claims", [])), 20)
+    anchor_terms, sub_claim_terms = _relevance_terms(state)
     source_domain = _domain(state.get("source_url", ""))
     seen_domains: Dict[str, int] = {}
     while queue and len(source_seen) < 35 and iterations < 220:
-        iterations += 1
-        url = _canon(queue.pop(0))
-        if url in source_seen:
-            continue
-        d = _domain(url)
-        if _blocked_domain(url):
-            continue
-        # Keep source diversity; avoid flooding from one domain.
-        if d and seen_domains.get(d, 0) >= 4:
-            continue
-        # Try direct first, then readable proxy fallback.
-        body = ""
-        try:
-            r = requests.get(url, timeout=20)
-            if r.status_code < 400:
-                body = _n(r.text)[:40000]
-        except Exception:
-            body = ""
-        if len(body) < 120:
-            body = _readable(url, 40000)
-
-        if not _is_relevant_candidate(url, body, anchor_terms, sub_claim_terms, source_domain):
-            continue
-        source_seen.add(url)
-        seen_domains[d] = seen_domains.get(d, 0) + 1
-        quote = _extract_quote(body, state["claim"])
-        snippet = quote or body[:260]
-        sources.append(
-            {
-                "title": d or "Source",
-                "url": url,
-                "snippet": snippet[:260],
-                "source": "web",
-                "quality": _quality(url),
-                "stance": _stance(state["claim"], snippet),
-                "quote": quote,
-            }
+        # Pop a wave of candidates and fetch them together; relevance is still judged in queue order.
+        wave: List[str] = []
+        while queue and len(wave) < _BFS_WAVE and iterations < 220:
+            iterations += 1
+            url = _canon(queue.popleft())
+            if url in source_seen or url in wave:
+                continue
+            d = _domain(url)
+            if _blocked_domain(url):
+                continue
+            # Keep source diversity; avoid flooding from one domain.
+            if d and seen_domains.get(d, 0) >= 4:
+                continue
+            wave.append(url)
+        bodies = await asyncio.gather(*(_fetch_body(u) for u in wave))
+        analyzed = await asyncio.to_thread(
+            _analyze_wave,
+            list(zip(wave, bodies)),
+            anchor_terms,
+            sub_claim_terms,
+            source_domain,
+            state["claim"],
+            True,
         )
-        newly_mentioned = _extract_links(body)
-        ranked = []
-        for x in newly_mentioned:
-            cx = _canon(x)
-            dx = _domain(cx)
-            if not dx or cx in source_seen or _blocked_domain(cx):
+
+        for url, body, result in zip(wave, bodies, analyzed):
+            if len(source_seen) >= 35:
+                break
+            d = _domain(url)
+            # Re-check: earlier URLs in this wave may have filled the domain quota.
+            if d and seen_domains.get(d, 0) >= 4:
+                continue
+            if result is None:
                 continue
-            ranked.append(cx)
-        ranked.sort(key=lambda x: (0 if source_domain and _domain(x).endswith(source_domain) else 1))
-        for x in ranked[:8]:
-            queue.append(x)
+            source_seen.add(url)
+            seen_domains[d] = seen_domains.get(d, 0) + 1
+            quote, newly_mentioned = result
+            snippet = quote or body[:260]
+            sources.append(
+                {
+                    "title": d or "Source",
+                    "url": url,
+                    "snippet": snippet[:260],
+                    "source": "web",
+                    "quality": _quality(url),
+                    "stance": _stance(snippet),
+                    "quote": quote,
+                }
+            )
+            ranked = []
+            # _extract_links already returns canonical URLs.
+            for x in newly_mentioned:
+                if not _domain(x) or x in source_seen or _blocked_domain(x):
+                    continue
+                ranked.append(x)
+            ranked.sort(key=lambda x: (0 if source_domain and _domain(x).endswith(source_domain) else 1))
+            queue.extend(ranked[:8])
     state["sources"] = sources
     state["timeline"].append(f"Browser chain: processed {len(sources)} quality sources.")
     return state
 
 
-def node_critic(state: GraphState) -> GraphState:
+async def node_critic(state: GraphState) -> GraphState:
     if len(state["sources"]) < 25:
         state["timeline"].append("Shallow / circular results. Pivoting to new angles:")
         c = state["claim"]
@@ -568,28 +782,38 @@ def node_critic(state: GraphState) -> GraphState:
             f"{c} filetype:pdf",
             f"{c} debunked false criticism",
         ]
-        more = []
-        for q in state["pivot_queries"]:
-            more.extend(_rss_links(q))
-            more.extend(_ddg_links(q))
+        pivots = await asyncio.gather(*(fn(q) for q in state["pivot_queries"] for fn in (_rss_links, _ddg_links)))
+        more = [l for links in pivots for l in links]
         seen = {x["url"] for x in state["sources"]}
+        candidates = []
         for l in more:
             cl = _canon(l)
             if cl and cl not in seen:
                 seen.add(cl)
                 if _blocked_domain(cl):
                     continue
-                body = _readable(cl, 25000)
-                sub_claim_terms = _keywords(" ".join(state.get("sub_claims", [])), 20)
-                if not _is_relevant_candidate(
-                    cl,
-                    body,
-                    state.get("anchor_terms", []),
-                    sub_claim_terms,
-                    _domain(state.get("source_url", "")),
-                ):
+                candidates.append(cl)
+        anchor_terms, sub_claim_terms = _relevance_terms(state)
+        source_domain = _domain(state.get("source_url", ""))
+        # Fetch pivot candidates in waves, same as the browser chain, and stop once the cap is met.
+        for i in range(0, len(candidates), _BFS_WAVE):
+            if len(state["sources"]) >= 35:
+                break
+            wave = candidates[i : i + _BFS_WAVE]
+            bodies = await asyncio.gather(*(_readable(cl, 25000) for cl in wave))
+            analyzed = await asyncio.to_thread(
+                _analyze_wave,
+                list(zip(wave, bodies)),
+                anchor_terms,
+                sub_claim_terms,
+                source_domain,
+                state["claim"],
+                False,
+            )
+            for cl, body, result in zip(wave, bodies, analyzed):
+                if result is None:
                     continue
-                quote = _extract_quote(body, state["claim"])
+                quote = result[0]
                 sn = quote or body[:260]
                 state["sources"].append(
                     {
@@ -598,7 +822,7 @@ def node_critic(state: GraphState) -> GraphState:
                         "snippet": sn[:260],
                         "source": "web",
                         "quality": _quality(cl),
-                        "stance": _stance(state["claim"], sn),
+                        "stance": _stance(sn),
                         "quote": quote,
                     }
                 )
@@ -635,9 +859,14 @@ def node_synthesizer(state: GraphState) -> GraphState:
             confidence = 78
 
     table = []
+    # Rows reuse the stance stored at ingestion and only count sources whose snippet
+    # shares terms with the sub-claim.
+    source_terms = [_term_set(s["snippet"]) for s in sources]
     for sc in state["sub_claims"]:
-        sup = [s for s in sources if _stance(sc, s["snippet"]) == "support"]
-        opp = [s for s in sources if _stance(sc, s["snippet"]) == "oppose"]
+        sc_terms = frozenset(_keywords(sc, 12))
+        related = [s for s, terms in zip(sources, source_terms) if not sc_terms or not sc_terms.isdisjoint(terms)]
+        sup = [s for s in related if s["stance"] == "support"]
+        opp = [s for s in related if s["stance"] == "oppose"]
         sv = "Unverifiable"
         if len(sup) > len(opp) * 2 and len(sup) >= 2:
             sv = "Mostly True"
@@ -693,7 +922,11 @@ def build_graph():
 
 
 GRAPH = build_graph()
-app = FastAPI(title="TrustLens FactCheck Graph API", version="1.0.0")
+app = FastAPI(
+    title="TrustLens FactCheck Graph API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -755,7 +988,7 @@ def _chat_fallback_answer(req: ChatRequest) -> str:
     )
 
 
-def _groq_answer(req: ChatRequest) -> Optional[str]:
+async def _groq_answer(req: ChatRequest) -> Optional[str]:
     api_key = os.getenv("GROQ_API_KEY", "").strip()
     if not api_key:
         return None
@@ -781,22 +1014,24 @@ def _groq_answer(req: ChatRequest) -> Optional[str]:
     messages.append({"role": "user", "content": _n(req.question)[:2500]})
 
     try:
-        r = requests.post(
+        async with _http_scope() as (session, _), session.post(
             "https://api.groq.com/openai/v1/chat/completions",
-            timeout=45,
+            timeout=_timeout(45),
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            json={
-                "model": model,
-                "temperature": 0.2,
-                "messages": messages,
-            },
-        )
-        if r.status_code >= 400:
-            return None
-        js = r.json()
+            data=orjson.dumps(
+                {
+                    "model": model,
+                    "temperature": 0.2,
+                    "messages": messages,
+                }
+            ),
+        ) as r:
+            if r.status >= 400:
+                return None
+            js = orjson.loads(await r.read())
         content = (
             js.get("choices", [{}])[0]
             .get("message", {})
@@ -813,13 +1048,14 @@ def health():
 
 
 @app.post("/api/factcheck/run", response_model=RunResponse)
-def run_factcheck(req: RunRequest):
+async def run_factcheck(req: RunRequest):
     if not req.claim and not req.source_url:
         raise HTTPException(status_code=400, detail="claim or source_url is required")
 
     start = time.time()
     state = _initial_state(req)
-    out = GRAPH.invoke(state)
+    async with _http_scope():
+        out = await GRAPH.ainvoke(state)
     elapsed = int((time.time() - start) * 1000)
 
     sources = [SourceItem(**s) for s in out["sources"][:35]]
@@ -845,10 +1081,10 @@ def run_factcheck(req: RunRequest):
 
 
 @app.post("/api/factcheck/chat", response_model=ChatResponse)
-def factcheck_chat(req: ChatRequest):
+async def factcheck_chat(req: ChatRequest):
     if not _n(req.question):
         raise HTTPException(status_code=400, detail="question is required")
-    ans = _groq_answer(req)
+    ans = await _groq_answer(req)
     if not ans:
         ans = _chat_fallback_answer(req)
     return ChatResponse(answer=ans, used_asset=bool(req.selected_asset))